@@ -0,0 +1,15 @@
+"""Shared pytest configuration for the test suite.
+
+Puts backend/src on sys.path once per process so test modules can
+import the backend packages (database, services) directly instead of
+each repeating its own sys.path manipulation at import time, and the
+tests/ directory itself so subpackages can import test_utils.
+"""
+
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "backend", "src")
+)
+sys.path.insert(0, os.path.dirname(__file__))
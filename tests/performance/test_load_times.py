@@ -0,0 +1,104 @@
+"""Performance test for page load times (T075).
+
+Verifies the constitutional <3s page-load budget for every frontend
+page, plus static asset delivery and behaviour under concurrent loads.
+"""
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from test_utils import PerfTestBase
+
+PAGES = ("dashboard", "transactions", "manage", "movements")
+
+
+def _load_one(url):
+    """Fetch one URL and time it; module-level so a process pool can
+    pickle it. Each worker process brings its own GIL and sockets."""
+    import time
+
+    import requests
+
+    start_ns = time.perf_counter_ns()
+    response = requests.get(url, timeout=5)
+    return url, time.perf_counter_ns() - start_ns, response.status_code
+
+
+STATIC_ASSETS = (
+    "/frontend/css/notion-base.css",
+    "/frontend/css/finance-app.css",
+    "/frontend/js/api.js",
+    "/frontend/js/components.js",
+    "/frontend/js/utils.js",
+)
+
+
+class PageLoadTimeTest(PerfTestBase):
+    """Constitutional budget: every page loads in under 3 seconds."""
+
+    max_load_time = 3.0
+    max_asset_time = 0.5
+    p95_budget_seconds = 3.0
+
+    def test_page_load_times(self):
+        """Each page document arrives inside the 3s budget."""
+        for page in PAGES:
+            path = f"/frontend/pages/{page}.html"
+            with self.subTest(page=page):
+                elapsed_ns, response = self._timed_get(path)
+                self.assertEqual(response.status_code, 200)
+                self.assert_response_time(
+                    elapsed_ns, self.max_load_time, path
+                )
+
+    def test_static_file_response_time(self):
+        """Stylesheets and scripts are served well under the budget."""
+        # A browser fetches these in parallel after parsing the page;
+        # fanning out over the pooled session mirrors that and caps the
+        # test's wall time at the slowest asset.
+        with ThreadPoolExecutor(max_workers=len(STATIC_ASSETS)) as pool:
+            results = list(pool.map(self._timed_get, STATIC_ASSETS))
+        for asset, (elapsed, response) in zip(STATIC_ASSETS, results):
+            with self.subTest(asset=asset):
+                self.assertEqual(response.status_code, 200)
+                self.assert_response_time(
+                    elapsed, self.max_asset_time, asset
+                )
+
+    def test_concurrent_load_performance(self):
+        """Pages stay inside the budget when loaded simultaneously."""
+        # Executor threads on the pooled session replace one bare
+        # Thread per URL: no per-request thread creation, and the
+        # requests reuse kept-alive connections instead of each paying
+        # a fresh handshake.
+        paths = tuple(f"/frontend/pages/{page}.html" for page in PAGES)
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            results = list(pool.map(self._timed_get, paths))
+        for path, (elapsed_ns, response) in zip(paths, results):
+            with self.subTest(page=path):
+                self.assertEqual(response.status_code, 200)
+                self.assert_response_time(
+                    elapsed_ns, self.max_load_time, path
+                )
+
+    def test_concurrent_load_multiprocess(self):
+        """Pages meet the budget under genuinely parallel client load."""
+        # The threaded variant above shares one interpreter, so
+        # response parsing serializes on the GIL and can mask
+        # server-side contention; worker processes each load truly
+        # simultaneously.
+        urls = tuple(
+            f"{self.base_url}/frontend/pages/{page}.html" for page in PAGES
+        )
+        with ProcessPoolExecutor(max_workers=len(urls)) as pool:
+            results = list(pool.map(_load_one, urls))
+        for url, elapsed_ns, status in results:
+            with self.subTest(page=url):
+                self.assertEqual(status, 200)
+                self.assert_response_time(
+                    elapsed_ns, self.max_load_time, url
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()